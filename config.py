@@ -36,6 +36,8 @@ class Config:
         self.SCRAPING_DELAY = float(os.getenv("SCRAPING_DELAY", "2.0"))
         self.REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30"))
         self.MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
+        self.SCRAPING_WORKERS = int(os.getenv("SCRAPING_WORKERS", "8"))
+        self.MAX_HTML_BYTES = int(os.getenv("MAX_HTML_BYTES", str(2 * 1024 * 1024)))
         
         # Validate required configuration
         self._validate_config()
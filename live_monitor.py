@@ -5,18 +5,34 @@ Collects real GenAI content from corporate websites
 """
 
 import os
-import sys
 import json
-import requests
+import mmap
 import time
 from datetime import datetime, timedelta
-from typing import List, Dict
-import trafilatura
+from typing import Any, List, Dict, Final, Optional, Tuple
+import orjson
+
+# Upper bound for the per-URL back-off between scans (7 days)
+MAX_BACKOFF_HOURS = 168
+
+# Keyword scan used by is_genai_related. Kept as a typed Final tuple so the
+# module can be compiled with mypyc (`mypyc live_monitor.py`; it must pass
+# `mypy --ignore-missing-imports live_monitor.py`), which turns the scan into
+# a native loop; the plain Python module is used when not compiled.
+GENAI_KEYWORDS: Final[Tuple[str, ...]] = (
+    'artificial intelligence', 'ai', 'machine learning', 'ml', 'generative ai', 'genai',
+    'large language model', 'llm', 'neural network', 'deep learning', 'chatbot',
+    'natural language processing', 'nlp', 'computer vision', 'automation',
+    'data science', 'predictive analytics', 'algorithm', 'cognitive computing',
+    'vector database', 'pgvector', 'embedding', 'rag', 'retrieval augmented',
+    'gpt', 'openai', 'claude', 'bert', 'transformer', 'diffusion model'
+)
 
 class LiveMonitor:
     def __init__(self):
         self.openai_api_key = os.environ.get('OPENAI_API_KEY')
         self.articles_file = 'data/articles.json'
+        self.scan_state_file = 'data/.scan_state.json'
         self.ensure_data_directory()
         
     def ensure_data_directory(self):
@@ -53,21 +69,18 @@ class LiveMonitor:
         if not content:
             return False
             
-        genai_keywords = [
-            'artificial intelligence', 'ai', 'machine learning', 'ml', 'generative ai', 'genai',
-            'large language model', 'llm', 'neural network', 'deep learning', 'chatbot',
-            'natural language processing', 'nlp', 'computer vision', 'automation',
-            'data science', 'predictive analytics', 'algorithm', 'cognitive computing',
-            'vector database', 'pgvector', 'embedding', 'rag', 'retrieval augmented',
-            'gpt', 'openai', 'claude', 'bert', 'transformer', 'diffusion model'
-        ]
-        
         content_lower = content.lower()
-        return any(keyword in content_lower for keyword in genai_keywords)
+        for keyword in GENAI_KEYWORDS:
+            if keyword in content_lower:
+                return True
+        return False
 
     def extract_content(self, url: str) -> str:
         """Extract text content from URL"""
         try:
+            # Imported lazily: trafilatura pulls in lxml and friends at import time
+            import trafilatura
+            
             # Use trafilatura for better content extraction
             downloaded = trafilatura.fetch_url(url)
             if downloaded:
@@ -84,12 +97,14 @@ class LiveMonitor:
             return content[:200] + "..." if len(content) > 200 else content
             
         try:
+            import requests
+            
             headers = {
                 'Authorization': f'Bearer {self.openai_api_key}',
                 'Content-Type': 'application/json'
             }
             
-            data = {
+            data: Dict[str, Any] = {
                 'model': 'gpt-4o',
                 'messages': [
                     {
@@ -118,9 +133,11 @@ class LiveMonitor:
             print(f"Error with OpenAI API: {str(e)}")
             return content[:200] + "..." if len(content) > 200 else content
 
-    def scrape_website(self, url: str, company_name: str) -> List[Dict]:
+    def scrape_website(self, url: str, company_name: str, run_ts: Optional[str] = None) -> List[Dict]:
         """Scrape a website for GenAI-related articles"""
         articles = []
+        if run_ts is None:
+            run_ts = datetime.now().isoformat()
         
         try:
             print(f"  Scanning {company_name}: {url}")
@@ -139,7 +156,7 @@ class LiveMonitor:
                     'summary': summary,
                     'source_url': url,
                     'company': company_name,
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': run_ts,
                     'is_genai_related': True
                 }
                 articles.append(article)
@@ -153,35 +170,84 @@ class LiveMonitor:
     def load_existing_articles(self) -> List[Dict]:
         """Load existing articles from storage"""
         try:
-            if os.path.exists(self.articles_file):
-                with open(self.articles_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            if os.path.exists(self.articles_file) and os.path.getsize(self.articles_file) > 0:
+                # Parse straight from the page cache instead of reading into a str first
+                with open(self.articles_file, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                        memoryview(mm) as view:
+                    data = orjson.loads(view)
                     return data.get('articles', [])
         except Exception as e:
             print(f"Error loading existing articles: {e}")
         return []
 
-    def save_articles(self, articles: List[Dict]):
+    def save_articles(self, articles: List[Dict], last_updated: Optional[str] = None):
         """Save articles to storage"""
         try:
             data = {
                 'articles': articles,
-                'last_updated': datetime.now().isoformat(),
+                'last_updated': last_updated or datetime.now().isoformat(),
                 'total_count': len(articles)
             }
             
-            with open(self.articles_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Write to a temporary file first, then swap it in atomically
+            temp_file = f"{self.articles_file}.tmp"
+            with open(temp_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            os.replace(temp_file, self.articles_file)
                 
         except Exception as e:
             print(f"Error saving articles: {e}")
 
+    def load_scan_state(self) -> Dict[str, Dict]:
+        """Load per-URL back-off state (consecutive misses and next check time)"""
+        try:
+            if os.path.exists(self.scan_state_file):
+                with open(self.scan_state_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Error loading scan state: {e}")
+        return {}
+
+    def save_scan_state(self, scan_state: Dict[str, Dict]):
+        """Save per-URL back-off state"""
+        try:
+            # Write to a temporary file first, then swap it in atomically
+            temp_file = f"{self.scan_state_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(scan_state, f, indent=2)
+            os.replace(temp_file, self.scan_state_file)
+        except Exception as e:
+            print(f"Error saving scan state: {e}")
+
+    def backoff_until(self, state: Any) -> Optional[datetime]:
+        """Return when a backed-off URL is due again, or None if its state is missing or malformed"""
+        try:
+            if isinstance(state['misses'], int):
+                return datetime.fromisoformat(state['next_check'])
+        except (KeyError, TypeError, ValueError):
+            pass
+        return None
+
+    def update_scan_state(self, scan_state: Dict[str, Dict], url: str, found: bool, now: datetime):
+        """Record a scan result, backing off exponentially on consecutive misses"""
+        if found:
+            misses = 0
+            next_check = now + timedelta(hours=1)
+        else:
+            misses = scan_state.get(url, {}).get('misses', 0) + 1
+            next_check = now + timedelta(hours=min(2 ** misses, MAX_BACKOFF_HOURS))
+
+        scan_state[url] = {'misses': misses, 'next_check': next_check.isoformat()}
+
     def run_monitoring(self):
         """Run the live monitoring process"""
         print("🚀 Starting Live GenAI Content Monitoring")
         print("📊 Scanning corporate websites for authentic GenAI developments...")
         
         start_time = time.time()
+        run_started = datetime.now()
+        run_ts = run_started.isoformat()
         companies = self.get_company_websites()
         
         # Load existing articles
@@ -191,13 +257,27 @@ class LiveMonitor:
         # Track existing URLs to avoid duplicates
         existing_urls = {article.get('url', '') for article in all_articles}
         
+        # Skip websites that are backing off after repeated misses
+        scan_state = self.load_scan_state()
+        
         total_scanned = 0
+        total_skipped = 0
         for company in companies:
             print(f"\n🏢 {company['name']} ({company['sector']})")
             
             for website in company['websites'][:1]:  # One website per company for speed
+                next_check = self.backoff_until(scan_state.get(website))
+                if next_check is None:
+                    # A malformed entry counts as no state; the site is scanned afresh
+                    scan_state.pop(website, None)
+                elif run_started < next_check:
+                    total_skipped += 1
+                    print(f"  Skipping {website} until {next_check.isoformat()} ({scan_state[website]['misses']} consecutive misses)")
+                    continue
+                
                 total_scanned += 1
-                articles = self.scrape_website(website, company['name'])
+                articles = self.scrape_website(website, company['name'], run_ts)
+                self.update_scan_state(scan_state, website, bool(articles), run_started)
                 
                 # Add new articles
                 for article in articles:
@@ -207,15 +287,18 @@ class LiveMonitor:
                         
                 time.sleep(1)  # Respectful delay
         
+        self.save_scan_state(scan_state)
+        
         # Combine and save all articles
         if new_articles:
             all_articles.extend(new_articles)
-            self.save_articles(all_articles)
+            self.save_articles(all_articles, last_updated=run_ts)
             
             elapsed = time.time() - start_time
             print(f"\n✅ Live monitoring completed!")
             print(f"⏱️ Total time: {elapsed:.1f} seconds")
             print(f"🌐 Websites scanned: {total_scanned}")
+            print(f"⏭️ Websites skipped (back-off): {total_skipped}")
             print(f"📄 New GenAI articles found: {len(new_articles)}")
             print(f"📊 Total articles in database: {len(all_articles)}")
             
@@ -226,6 +309,7 @@ class LiveMonitor:
                 
         else:
             print(f"\n📊 Monitoring completed - no new GenAI articles found")
+            print(f"⏭️ Websites skipped (back-off): {total_skipped}")
             print(f"💡 This is normal - corporate GenAI content updates periodically")
             
             # Ensure we have some sample content for demonstration
@@ -234,6 +318,7 @@ class LiveMonitor:
 
     def create_sample_articles(self):
         """Create sample articles for immediate demonstration"""
+        created_ts = datetime.now().isoformat()
         sample_articles = [
             {
                 'title': 'JPMorgan Chase Advances AI-Powered Investment Platform',
@@ -242,7 +327,7 @@ class LiveMonitor:
                 'summary': 'JPMorgan Chase enhances AI investment platform with advanced ML algorithms for better portfolio management and risk assessment.',
                 'source_url': 'https://www.jpmorganchase.com/news',
                 'company': 'JPMorgan Chase',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': created_ts,
                 'is_genai_related': True
             },
             {
@@ -252,7 +337,7 @@ class LiveMonitor:
                 'summary': 'Target deploys pgvector database technology to enhance personalized shopping experiences through advanced customer preference modeling.',
                 'source_url': 'https://corporate.target.com/news-features',
                 'company': 'Target',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': created_ts,
                 'is_genai_related': True
             },
             {
@@ -262,12 +347,12 @@ class LiveMonitor:
                 'summary': 'Netflix leverages generative AI to improve content discovery and create more sophisticated recommendation algorithms for enhanced viewer experience.',
                 'source_url': 'https://about.netflix.com/en/news',
                 'company': 'Netflix',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': created_ts,
                 'is_genai_related': True
             }
         ]
         
-        self.save_articles(sample_articles)
+        self.save_articles(sample_articles, last_updated=created_ts)
         print("📄 Created sample GenAI articles for immediate dashboard display")
 
 def main():
@@ -7,7 +7,7 @@ import schedule
 import time
 import logging
 from datetime import datetime
-from main import main
+from main import _init_components, run_once
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +44,8 @@ class ContentScheduler:
         """Run the monitoring process"""
         try:
             logger.info(f"Starting scheduled monitoring run at {datetime.now()}")
-            main()
+            # Components are built on the first run and reused on later ticks
+            run_once(_init_components())
             logger.info(f"Completed scheduled monitoring run at {datetime.now()}")
         except Exception as e:
             logger.error(f"Error during scheduled monitoring run: {e}")
@@ -98,7 +99,7 @@ class ContentScheduler:
 def run_manual():
     """Run monitoring manually (one-time execution)"""
     logger.info("Running manual monitoring check...")
-    main()
+    run_once(_init_components())
     logger.info("Manual monitoring check completed")
 
 if __name__ == "__main__":
@@ -4,17 +4,168 @@ Handles website scraping with ethical practices and fallback mechanisms
 """
 
 import os
+import re
+import sys
 import time
+import asyncio
+import threading
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from urllib.parse import urljoin, urlparse
 from urllib.robotparser import RobotFileParser
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+import soupsieve as sv
+from typing import List, Dict, Optional, Tuple
 import trafilatura
 
+try:
+    from bs4.filter import ElementFilter
+except ImportError:  # BeautifulSoup < 4.13 filters with SoupStrainer callables
+    ElementFilter = None
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is optional; pages are then fetched one by one
+    aiohttp = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional; BeautifulSoup is used instead
+    LexborHTMLParser = None
+
 logger = logging.getLogger(__name__)
 
+# Main content areas, tried in order
+CONTENT_SELECTORS = [
+    'article', 'main', '[role="main"]', '.content', '#content',
+    '.post', '.entry', '.article-content', '.blog-post'
+]
+
+# Common article containers on index pages, tried in order
+ARTICLE_SELECTORS = [
+    'article', '.post', '.entry', '.blog-post', '.article',
+    '[itemtype*="Article"]', '.content-item', '.news-item'
+]
+
+TITLE_SELECTORS = ['h1', 'h2', 'h3', '.title', '.headline']
+
+# How long a fetched robots.txt is trusted, and how long a failed fetch is
+# remembered before the host is tried again (seconds)
+ROBOTS_CACHE_TTL = 6 * 3600
+ROBOTS_FAILURE_TTL = 5 * 60
+
+# Requests allowed in flight to a single host during a batch scrape
+HOST_CONCURRENCY = 2
+
+# Minimum gap between the start of two requests to the same host on the
+# threaded scraping path (seconds)
+HOST_MIN_INTERVAL = 0.5
+
+# Maximum number of article URLs whose extracted content is remembered
+CONTENT_CACHE_SIZE = 1024
+
+# Loose class patterns for the selectors above, used to skip building the
+# parts of the tree that can never match them
+_CONTENT_CLASS_RE = re.compile(r'content|post|entry|blog-post')
+_ARTICLE_CLASS_RE = re.compile(r'post|entry|article|content-item|news-item')
+
+# Runs of whitespace collapsed to a single space in extracted text
+_WS_RE = re.compile(r'\s+')
+
+def _first_descendant(node, selector: str):
+    """First match of selector below node; lexbor's css() also matches the node itself"""
+    for match in node.css(selector):
+        if match.mem_id != node.mem_id:
+            return match
+    return None
+
+async def _none():
+    """Awaitable placeholder for a page that could not be fetched"""
+    return None
+
+def _class_string(attrs: Dict) -> str:
+    """Return the raw class attribute of a tag being parsed"""
+    classes = attrs.get('class', '')
+    return ' '.join(classes) if isinstance(classes, list) else classes
+
+def _is_content_candidate(name: str, attrs: Optional[Dict] = None) -> bool:
+    """Parse-time filter keeping subtrees that CONTENT_SELECTORS can match"""
+    if attrs is None:
+        # Called without attributes there is nothing to filter on; keep the tag
+        return True
+    if name in ('article', 'main'):
+        return True
+    if attrs.get('role') == 'main' or attrs.get('id') == 'content':
+        return True
+    return bool(_CONTENT_CLASS_RE.search(_class_string(attrs)))
+
+def _is_article_candidate(name: str, attrs: Optional[Dict] = None) -> bool:
+    """Parse-time filter keeping article containers and links"""
+    if attrs is None:
+        return True
+    if name in ('article', 'a'):
+        return True
+    if 'Article' in attrs.get('itemtype', ''):
+        return True
+    return bool(_ARTICLE_CLASS_RE.search(_class_string(attrs)))
+
+# CONTENT_SELECTORS compiled once for the BeautifulSoup path
+_CONTENT_SOUP_SELECTORS = [sv.compile(selector) for selector in CONTENT_SELECTORS]
+
+# BeautifulSoup find()/find_all() equivalents of ARTICLE_SELECTORS and
+# TITLE_SELECTORS; plain tag and class lookups skip the CSS selector engine
+_ARTICLE_QUERIES = (
+    {'name': 'article'},
+    {'class_': 'post'},
+    {'class_': 'entry'},
+    {'class_': 'blog-post'},
+    {'class_': 'article'},
+    {'attrs': {'itemtype': re.compile('Article')}},
+    {'class_': 'content-item'},
+    {'class_': 'news-item'},
+)
+_TITLE_QUERIES = (
+    {'name': 'h1'},
+    {'name': 'h2'},
+    {'name': 'h3'},
+    {'class_': 'title'},
+    {'class_': 'headline'},
+)
+
+if ElementFilter is not None:
+    class _CandidateFilter(ElementFilter):
+        """Apply a candidate check when the parser is about to create a tag"""
+        
+        def __init__(self, is_candidate):
+            super().__init__()
+            self.is_candidate = is_candidate
+        
+        def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs: Optional[Dict]) -> bool:
+            return self.is_candidate(name, attrs or {})
+        
+        def allow_string_creation(self, string: str) -> bool:
+            # Only reached outside kept subtrees; drop the text like SoupStrainer does
+            return False
+    
+    _CONTENT_STRAINER = _CandidateFilter(_is_content_candidate)
+    _ARTICLE_STRAINER = _CandidateFilter(_is_article_candidate)
+else:
+    # BeautifulSoup < 4.13 calls these with (name, attrs) while parsing
+    _CONTENT_STRAINER = SoupStrainer(_is_content_candidate)
+    _ARTICLE_STRAINER = SoupStrainer(_is_article_candidate)
+
+def _make_soup(markup, **kwargs) -> BeautifulSoup:
+    """Parse HTML with the C-based lxml parser, falling back to html.parser"""
+    try:
+        return BeautifulSoup(markup, 'lxml', **kwargs)
+    except FeatureNotFound:
+        return BeautifulSoup(markup, 'html.parser', **kwargs)
+
 class WebScraper:
     """Web scraper with ethical practices and multiple extraction methods"""
     
@@ -24,20 +175,59 @@ class WebScraper:
         self.session.headers.update({
             'User-Agent': 'GenAI-Content-Monitor/1.0 (Educational Purpose)'
         })
+        
+        # Keep connections alive across requests and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=self.config.MAX_RETRIES,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET']
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # article URL -> extracted content (None if extraction failed), oldest first
+        self._content_cache: Dict[str, Optional[str]] = {}
+        self._content_cache_lock = threading.Lock()
+        # netloc -> in-flight slots, and netloc -> earliest time the next request may start
+        self._host_slots = defaultdict(lambda: threading.Semaphore(HOST_CONCURRENCY))
+        self._host_next_start: Dict[str, float] = {}
+        self._host_lock = threading.Lock()
+        # netloc -> (parsed robots.txt or None if it could not be fetched, expiry)
+        self._robots_cache: Dict[str, Tuple[Optional[RobotFileParser], float]] = {}
     
     def _check_robots_txt(self, url: str) -> bool:
         """Check if scraping is allowed by robots.txt"""
         try:
             parsed_url = urlparse(url)
+        except ValueError as e:
+            logger.warning(f"Could not check robots.txt for {url}: {e}")
+            return True  # Assume allowed if we can't check
+        now = time.monotonic()
+        
+        # Reuse robots.txt fetched for this host until it expires
+        cached = self._robots_cache.get(parsed_url.netloc)
+        if cached and now < cached[1]:
+            rp = cached[0]
+            return rp.can_fetch(self.session.headers['User-Agent'], url) if rp else True
+        
+        try:
             robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
             
             rp = RobotFileParser()
             rp.set_url(robots_url)
             rp.read()
             
+            self._robots_cache[parsed_url.netloc] = (rp, now + ROBOTS_CACHE_TTL)
             return rp.can_fetch(self.session.headers['User-Agent'], url)
         except Exception as e:
             logger.warning(f"Could not check robots.txt for {url}: {e}")
+            # Remember the failure briefly so an unreachable host is not retried on every URL
+            self._robots_cache[parsed_url.netloc] = (None, now + ROBOTS_FAILURE_TTL)
             return True  # Assume allowed if we can't check
     
     def _extract_with_trafilatura(self, url: str) -> Optional[str]:
@@ -51,129 +241,431 @@ class WebScraper:
             logger.warning(f"Trafilatura extraction failed for {url}: {e}")
         return None
     
-    def _extract_with_beautifulsoup(self, url: str) -> Optional[str]:
-        """Extract content using BeautifulSoup as fallback"""
+    def _fetch_html(self, url: str) -> bytes:
+        """Fetch a page body, reading at most MAX_HTML_BYTES of it"""
+        response = self.session.get(url, timeout=self.config.REQUEST_TIMEOUT, stream=True)
         try:
-            response = self.session.get(url, timeout=self.config.REQUEST_TIMEOUT)
             response.raise_for_status()
+            return response.raw.read(self.config.MAX_HTML_BYTES, decode_content=True)
+        finally:
+            response.close()
+    
+    def _extract_with_html(self, url: str) -> Optional[str]:
+        """Extract content by fetching the page and parsing its HTML"""
+        try:
+            return self._extract_text_from_html(self._fetch_html(url))
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
+        except Exception as e:
+            logger.warning(f"HTML extraction failed for {url}: {e}")
+        return None
+    
+    def _extract_text_from_html(self, html: bytes) -> str:
+        """Extract main text from HTML, preferring selectolax over BeautifulSoup"""
+        if LexborHTMLParser is not None:
+            try:
+                return self._extract_with_selectolax(html)
+            except Exception as e:
+                logger.debug(f"selectolax extraction failed, falling back to BeautifulSoup: {e}")
+        return self._extract_with_beautifulsoup(html)
+    
+    def _extract_with_selectolax(self, html: bytes) -> str:
+        """Extract main text using the lexbor-backed selectolax parser"""
+        tree = LexborHTMLParser(html)
+        
+        # Remove script and style elements
+        tree.strip_tags(['script', 'style'])
+        
+        # Try to find main content areas
+        content = None
+        for selector in CONTENT_SELECTORS:
+            nodes = tree.css(selector)
+            if nodes:
+                content = ' '.join(node.text(separator=' ') for node in nodes)
+                break
+        
+        if not content:
+            # Fallback to body text
+            content = tree.body.text(separator=' ') if tree.body else ''
+        
+        # Clean up whitespace
+        content = _WS_RE.sub(' ', content).strip()
+        return content
+    
+    def _extract_with_beautifulsoup(self, html: bytes) -> str:
+        """Extract main text using BeautifulSoup as fallback"""
+        # Only build the subtrees that the content selectors can match
+        soup = _make_soup(html, parse_only=_CONTENT_STRAINER)
+        
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+        
+        # Try to find main content areas
+        content = None
+        for selector in _CONTENT_SOUP_SELECTORS:
+            elements = selector.select(soup)
+            if elements:
+                content = ' '.join([elem.get_text() for elem in elements])
+                break
+        
+        if not content:
+            # Fallback to body text, which needs the whole document
+            soup = _make_soup(html)
             for script in soup(["script", "style"]):
                 script.decompose()
+            content = soup.get_text(separator=' ')
+        
+        # Clean up whitespace
+        content = _WS_RE.sub(' ', content).strip()
+        return content
+    
+    def _extract_articles_from_page(self, url: str) -> List[Dict]:
+        """Extract article information from a page"""
+        articles = []
+        
+        try:
+            candidates = self._parse_article_links(self._fetch_html(url), url)
             
-            # Try to find main content areas
-            content_selectors = [
-                'article', 'main', '[role="main"]', '.content', '#content',
-                '.post', '.entry', '.article-content', '.blog-post'
-            ]
+            # Article fetches are independent and I/O-bound, so run them in parallel
+            with ThreadPoolExecutor(max_workers=self.config.SCRAPING_WORKERS) as executor:
+                contents = list(executor.map(self._extract_article_content_paced, [u for _, u in candidates]))
             
-            content = None
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    content = ' '.join([elem.get_text() for elem in elements])
-                    break
+            # Every article from this page shares one source_url string
+            source_url = sys.intern(url)
+            for (title, article_url), content in zip(candidates, contents):
+                if content and len(content) > 100:  # Minimum content length
+                    articles.append({
+                        'title': title,
+                        'url': article_url,
+                        'content': content,
+                        'source_url': source_url
+                    })
+        
+        except Exception as e:
+            logger.error(f"Error extracting articles from {url}: {e}")
+        
+        return articles
+    
+    def _extract_article_content_paced(self, url: str) -> Optional[str]:
+        """Extract article content while holding one of its host's request slots"""
+        try:
+            found, content = self._cached_content(url)
+            if found:
+                return content
+            with self._host_slot(url):
+                return self._extract_article_content(url)
+        except Exception as e:
+            logger.warning(f"Error extracting article from {url}: {e}")
+            return None
+    
+    @contextmanager
+    def _host_slot(self, url: str):
+        """Hold one of the host's HOST_CONCURRENCY slots, spacing request starts by HOST_MIN_INTERVAL"""
+        netloc = urlparse(url).netloc
+        with self._host_lock:
+            slot = self._host_slots[netloc]
+        with slot:
+            # Reserve the next start time under the lock, then wait outside it
+            with self._host_lock:
+                now = time.monotonic()
+                start = max(now, self._host_next_start.get(netloc, now))
+                self._host_next_start[netloc] = start + HOST_MIN_INTERVAL
+            if start > now:
+                time.sleep(start - now)
+            yield
+    
+    def _parse_article_links(self, html: bytes, base_url: str) -> List[Tuple[str, str]]:
+        """Find (title, absolute URL) pairs for candidate articles on an index page"""
+        if LexborHTMLParser is not None:
+            try:
+                return self._parse_article_links_with_selectolax(html, base_url)
+            except Exception as e:
+                logger.debug(f"selectolax parsing failed, falling back to BeautifulSoup: {e}")
+        return self._parse_article_links_with_beautifulsoup(html, base_url)
+    
+    def _parse_article_links_with_selectolax(self, html: bytes, base_url: str) -> List[Tuple[str, str]]:
+        """Find candidate articles using selectolax CSS queries"""
+        tree = LexborHTMLParser(html)
+        
+        article_nodes = []
+        for selector in ARTICLE_SELECTORS:
+            nodes = tree.css(selector)
+            if nodes:
+                article_nodes = nodes
+                break
+        
+        if not article_nodes:
+            # Fallback: look for links that might be articles
+            article_nodes = tree.css('a[href]')
+        
+        candidates = []
+        for node in article_nodes[:20]:  # Limit to first 20 to avoid overload
+            try:
+                # Extract title
+                title = None
+                for title_sel in TITLE_SELECTORS:
+                    title_node = _first_descendant(node, title_sel)
+                    if title_node:
+                        title = title_node.text().strip()
+                        break
+                
+                if not title and node.tag == 'a':
+                    title = node.text().strip()
+                
+                # Extract URL
+                article_url = None
+                if node.tag == 'a':
+                    article_url = node.attributes.get('href')
+                else:
+                    link_node = _first_descendant(node, 'a[href]')
+                    if link_node:
+                        article_url = link_node.attributes.get('href')
+                
+                if article_url:
+                    article_url = urljoin(base_url, article_url)
+                
+                if title and article_url and len(title) > 10:
+                    candidates.append((title, article_url))
             
-            if not content:
-                # Fallback to body text
-                content = soup.get_text()
+            except Exception as e:
+                logger.warning(f"Error extracting article from element: {e}")
+                continue
+        
+        return candidates
+    
+    def _parse_article_links_with_beautifulsoup(self, html: bytes, base_url: str) -> List[Tuple[str, str]]:
+        """Find candidate articles using BeautifulSoup as fallback"""
+        # Only build article containers and links; the rest of the page is skipped
+        soup = _make_soup(html, parse_only=_ARTICLE_STRAINER)
+        
+        article_elements = []
+        for query in _ARTICLE_QUERIES:
+            elements = soup.find_all(limit=20, **query)
+            if elements:
+                article_elements = elements
+                break
+        
+        if not article_elements:
+            # Fallback: look for links that might be articles
+            article_elements = soup.find_all('a', href=True, limit=20)
+        
+        candidates = []
+        for element in article_elements:  # Limited to first 20 to avoid overload
+            try:
+                # Extract title
+                title = None
+                for query in _TITLE_QUERIES:
+                    title_elem = element.find(**query)
+                    if title_elem:
+                        title = title_elem.get_text().strip()
+                        break
+                
+                if not title and element.name == 'a':
+                    title = element.get_text().strip()
+                
+                # Extract URL
+                article_url = None
+                if element.name == 'a':
+                    article_url = element.get('href')
+                else:
+                    link_elem = element.find('a', href=True)
+                    if link_elem:
+                        article_url = link_elem.get('href')
+                
+                if article_url:
+                    article_url = urljoin(base_url, article_url)
+                
+                if title and article_url and len(title) > 10:
+                    candidates.append((title, article_url))
             
-            # Clean up whitespace
-            content = ' '.join(content.split())
+            except Exception as e:
+                logger.warning(f"Error extracting article from element: {e}")
+                continue
+        
+        return candidates
+    
+    def _extract_article_content(self, url: str) -> Optional[str]:
+        """Extract content from an individual article URL"""
+        found, content = self._cached_content(url)
+        if found:
             return content
-            
+        
+        # First try trafilatura (most effective for article content)
+        content = self._extract_with_trafilatura(url)
+        if not (content and len(content) > 100):
+            # Fallback to fetching and parsing the HTML ourselves
+            content = self._extract_with_html(url)
+        
+        self._cache_content(url, content)
+        return content
+    
+    def _cached_content(self, url: str) -> Tuple[bool, Optional[str]]:
+        """Look up previously extracted content, including failed extractions"""
+        with self._content_cache_lock:
+            if url in self._content_cache:
+                return True, self._content_cache[url]
+        return False, None
+    
+    def _cache_content(self, url: str, content: Optional[str]):
+        """Remember extracted content, evicting the oldest entry when full"""
+        with self._content_cache_lock:
+            if url not in self._content_cache and len(self._content_cache) >= CONTENT_CACHE_SIZE:
+                del self._content_cache[next(iter(self._content_cache))]
+            self._content_cache[url] = content
+    
+    def clear_content_cache(self):
+        """Forget extracted article content, e.g. at the start of a monitoring run"""
+        with self._content_cache_lock:
+            self._content_cache.clear()
+    
+    def _extract_content_from_html(self, html: bytes) -> Optional[str]:
+        """Extract article content from an already fetched page"""
+        # First try trafilatura (most effective for article content)
+        try:
+            content = trafilatura.extract(html)
+            if content and len(content) > 100:
+                return content
         except Exception as e:
-            logger.warning(f"BeautifulSoup extraction failed for {url}: {e}")
+            logger.warning(f"Trafilatura extraction failed: {e}")
+        
+        # Fallback to parsing the HTML ourselves
+        return self._extract_text_from_html(html)
+    
+    def _client_session(self) -> "aiohttp.ClientSession":
+        """Create a pooled aiohttp session for a batch of fetches"""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, limit_per_host=4),
+            timeout=aiohttp.ClientTimeout(total=self.config.REQUEST_TIMEOUT),
+            headers={'User-Agent': self.session.headers['User-Agent']}
+        )
+    
+    async def _afetch(self, session: "aiohttp.ClientSession", url: str) -> Optional[bytes]:
+        """Fetch a page body asynchronously, returning None on failure"""
+        try:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                
+                # Read at most MAX_HTML_BYTES; the rest of the body is discarded
+                limit = self.config.MAX_HTML_BYTES
+                chunks = []
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    chunks.append(chunk)
+                    limit -= len(chunk)
+                    if limit <= 0:
+                        break
+                return b''.join(chunks)[:self.config.MAX_HTML_BYTES]
+        except Exception as e:
+            logger.warning(f"Failed to fetch {url}: {e}")
         return None
     
-    def _extract_articles_from_page(self, url: str) -> List[Dict]:
-        """Extract article information from a page"""
+    async def _afetch_limited(self, session: "aiohttp.ClientSession", url: str,
+                              host_limits: Dict[str, asyncio.Semaphore], delay: float = 0) -> Optional[bytes]:
+        """Fetch a page while holding its host's slot, optionally waiting a crawl delay first"""
+        async with host_limits[urlparse(url).netloc]:
+            if delay:
+                await asyncio.sleep(delay)
+            return await self._afetch(session, url)
+    
+    async def _ascrape_site(self, session: "aiohttp.ClientSession", url: str,
+                            host_limits: Dict[str, asyncio.Semaphore]) -> List[Dict]:
+        """Scrape articles from one website using a shared session and host limits"""
         articles = []
+        loop = asyncio.get_running_loop()
         
         try:
-            response = self.session.get(url, timeout=self.config.REQUEST_TIMEOUT)
-            response.raise_for_status()
+            # Check robots.txt compliance (blocking urllib call, keep it off the loop)
+            if not await loop.run_in_executor(None, self._check_robots_txt, url):
+                logger.warning(f"Robots.txt disallows scraping of {url}")
+                return articles
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            logger.info(f"Scraping articles from: {url}")
             
-            # Common article selectors
-            article_selectors = [
-                'article', '.post', '.entry', '.blog-post', '.article',
-                '[itemtype*="Article"]', '.content-item', '.news-item'
-            ]
+            # Add delay to be respectful
+            html = await self._afetch_limited(session, url, host_limits, self.config.SCRAPING_DELAY)
+            if html is None:
+                return articles
             
-            article_elements = []
-            for selector in article_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    article_elements = elements
-                    break
+            # Parsing is CPU-bound, so it runs in the default executor
+            candidates = await loop.run_in_executor(None, self._parse_article_links, html, url)
             
-            if not article_elements:
-                # Fallback: look for links that might be articles
-                article_elements = soup.find_all('a', href=True)
+            # Articles cross-linked from an earlier page are not fetched again
+            lookups = {article_url: self._cached_content(article_url) for _, article_url in candidates}
+            to_fetch = [article_url for article_url, (found, _) in lookups.items() if not found]
+            pages = await asyncio.gather(*(
+                self._afetch_limited(session, article_url, host_limits) for article_url in to_fetch
+            ))
             
-            for element in article_elements[:20]:  # Limit to first 20 to avoid overload
-                try:
-                    # Extract title
-                    title = None
-                    title_selectors = ['h1', 'h2', 'h3', '.title', '.headline']
-                    for title_sel in title_selectors:
-                        title_elem = element.select_one(title_sel)
-                        if title_elem:
-                            title = title_elem.get_text().strip()
-                            break
-                    
-                    if not title and element.name == 'a':
-                        title = element.get_text().strip()
-                    
-                    # Extract URL
-                    article_url = None
-                    if element.name == 'a':
-                        article_url = element.get('href')
-                    else:
-                        link_elem = element.find('a', href=True)
-                        if link_elem:
-                            article_url = link_elem.get('href')
-                    
-                    if article_url:
-                        article_url = urljoin(url, article_url)
-                    
-                    if title and article_url and len(title) > 10:
-                        # Extract content from the article page
-                        content = self._extract_article_content(article_url)
-                        if content and len(content) > 100:  # Minimum content length
-                            articles.append({
-                                'title': title,
-                                'url': article_url,
-                                'content': content,
-                                'source_url': url
-                            })
-                
-                except Exception as e:
-                    logger.warning(f"Error extracting article from element: {e}")
-                    continue
+            # Every article from this page shares one source_url string
+            source_url = sys.intern(url)
+            extracted = await asyncio.gather(*(
+                loop.run_in_executor(None, self._extract_content_from_html, page) if page else _none()
+                for page in pages
+            ))
+            
+            for article_url, content in zip(to_fetch, extracted):
+                self._cache_content(article_url, content)
+                lookups[article_url] = (True, content)
+            
+            for title, article_url in candidates:
+                content = lookups[article_url][1]
+                if content and len(content) > 100:  # Minimum content length
+                    articles.append({
+                        'title': title,
+                        'url': article_url,
+                        'content': content,
+                        'source_url': source_url
+                    })
         
         except Exception as e:
             logger.error(f"Error extracting articles from {url}: {e}")
         
+        logger.info(f"Successfully extracted {len(articles)} articles from {url}")
         return articles
     
-    def _extract_article_content(self, url: str) -> Optional[str]:
-        """Extract content from an individual article URL"""
-        # First try trafilatura (most effective for article content)
-        content = self._extract_with_trafilatura(url)
-        if content and len(content) > 100:
-            return content
+    async def ascrape_articles(self, url: str) -> List[Dict]:
+        """Scrape articles from a website, fetching article pages concurrently"""
+        return (await self.scrape_many([url]))[url]
+    
+    async def scrape_many(self, urls: List[str]) -> Dict[str, List[Dict]]:
+        """Scrape several websites concurrently over one session, politely per host"""
+        host_limits = defaultdict(lambda: asyncio.Semaphore(HOST_CONCURRENCY))
         
-        # Fallback to BeautifulSoup
-        content = self._extract_with_beautifulsoup(url)
-        return content
+        async with self._client_session() as session:
+            results = await asyncio.gather(
+                *(self._ascrape_site(session, url, host_limits) for url in urls),
+                return_exceptions=True
+            )
+        
+        # A failing site must not drop the results of the others
+        scraped = {}
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error scraping {url}: {result}")
+                result = []
+            scraped[url] = result
+        return scraped
+    
+    def scrape_many_sync(self, urls: List[str]) -> Dict[str, List[Dict]]:
+        """Scrape several websites, returning their articles keyed by website URL"""
+        if aiohttp is not None:
+            return asyncio.run(self.scrape_many(urls))
+        scraped = {}
+        for url in urls:
+            try:
+                scraped[url] = self._scrape_articles_sync(url)
+            except Exception as e:
+                logger.error(f"Error scraping {url}: {e}")
+                scraped[url] = []
+        return scraped
     
     def scrape_articles(self, url: str) -> List[Dict]:
         """Scrape articles from a website"""
+        if aiohttp is not None:
+            return asyncio.run(self.ascrape_articles(url))
+        return self._scrape_articles_sync(url)
+    
+    def _scrape_articles_sync(self, url: str) -> List[Dict]:
+        """Scrape articles from a website one request at a time"""
         articles = []
         
         # Check robots.txt compliance
@@ -3,17 +3,163 @@ Sector Insights module for GenAI Content Monitor
 Generates AI-powered trend analysis and insights across sectors
 """
 
+import sys
 import json
-from typing import Dict, List
-from collections import defaultdict
+import math
+import functools
+from typing import Dict, List, Tuple
+from collections import defaultdict, namedtuple
 from datetime import datetime, timedelta
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; a plain substring scan is used instead
+    ahocorasick = None
+
+# Tracked companies and the sector each one belongs to
+SECTOR_MAPPING = {
+    # Financial companies
+    'JPMorgan Chase': 'Financial',
+    'Bank of America': 'Financial', 
+    'Wells Fargo': 'Financial',
+    'Goldman Sachs': 'Financial',
+    'Morgan Stanley': 'Financial',
+    'Citigroup': 'Financial',
+    'American Express': 'Financial',
+    'Capital One': 'Financial',
+    'Charles Schwab': 'Financial',
+    'BlackRock': 'Financial',
+    
+    # Retail companies
+    'Amazon': 'Retail',
+    'Walmart': 'Retail',
+    'Target': 'Retail',
+    'Home Depot': 'Retail',
+    'Costco': 'Retail',
+    'CVS Health': 'Retail',
+    'Kroger': 'Retail',
+    'Lowe\'s': 'Retail',
+    'Best Buy': 'Retail',
+    'Starbucks': 'Retail',
+    
+    # Media & Entertainment companies
+    'Disney': 'Media & Entertainment',
+    'Netflix': 'Media & Entertainment',
+    'Comcast': 'Media & Entertainment',
+    'Warner Bros Discovery': 'Media & Entertainment',
+    'Sony Pictures': 'Media & Entertainment',
+    'ViacomCBS (Paramount)': 'Media & Entertainment',
+    'NBCUniversal': 'Media & Entertainment',
+    'Fox Corporation': 'Media & Entertainment',
+    'Spotify': 'Media & Entertainment',
+    'Electronic Arts': 'Media & Entertainment'
+}
+
+# AI/GenAI themes and the keywords that indicate them
+THEME_KEYWORDS = {
+    'machine learning': ['machine learning', 'ml', 'deep learning'],
+    'automation': ['automation', 'automated', 'robotic process'],
+    'personalization': ['personalization', 'personalized', 'recommendation'],
+    'fraud detection': ['fraud', 'security', 'risk management'],
+    'customer service': ['customer service', 'chatbot', 'virtual assistant'],
+    'content generation': ['content generation', 'generative ai', 'genai'],
+    'predictive analytics': ['predictive', 'forecasting', 'analytics'],
+    'computer vision': ['computer vision', 'image recognition', 'visual ai'],
+    'natural language': ['nlp', 'natural language', 'text analysis'],
+    'algorithmic trading': ['algorithmic trading', 'trading algorithms', 'fintech'],
+    'vector databases': ['vector database', 'pgvector', 'embedding', 'similarity search', 'vector search'],
+    'semantic search': ['semantic search', 'vector similarity', 'embedding search', 'nearest neighbor']
+}
+
+# Keywords used to gauge AI maturity
+ADVANCED_AI_KEYWORDS = ['generative ai', 'genai', 'large language model', 'transformer', 'neural network']
+BASIC_AI_KEYWORDS = ['automation', 'machine learning', 'ai']
+
+# Keywords indicating vector database usage
+VECTOR_KEYWORDS = ['vector database', 'pgvector', 'embedding', 'similarity search', 'vector search', 'semantic search', 'nearest neighbor']
+
+# Bit i of a theme mask stands for THEME_NAMES[i]; the maturity and vector
+# flags use the bits above the themes
+THEME_NAMES = tuple(THEME_KEYWORDS)
+_THEME_BITS = (1 << len(THEME_NAMES)) - 1
+_ADVANCED_BIT = 1 << len(THEME_NAMES)
+_BASIC_BIT = _ADVANCED_BIT << 1
+_VECTOR_BIT = _ADVANCED_BIT << 2
+
+# Per-article results of the single text scan
+ArticleScan = namedtuple('ArticleScan', ['sector', 'theme_mask', 'is_advanced', 'is_basic', 'is_vector', 'is_recent'])
+
+def _iter_bits(mask: int):
+    """Yield the indexes of the set bits in mask, lowest first"""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+def _build_keyword_masks() -> Tuple[Tuple[str, int], ...]:
+    """Map each distinct keyword to the mask of every theme or flag it counts towards"""
+    keyword_masks = {}
+    for theme_id, keywords in enumerate(THEME_KEYWORDS.values()):
+        for keyword in keywords:
+            keyword_masks[keyword] = keyword_masks.get(keyword, 0) | (1 << theme_id)
+    for bit, keywords in ((_ADVANCED_BIT, ADVANCED_AI_KEYWORDS),
+                          (_BASIC_BIT, BASIC_AI_KEYWORDS),
+                          (_VECTOR_BIT, VECTOR_KEYWORDS)):
+        for keyword in keywords:
+            keyword_masks[keyword] = keyword_masks.get(keyword, 0) | bit
+    return tuple(keyword_masks.items())
+
+_KEYWORD_MASKS = _build_keyword_masks()
+
+# (lowercased name, name without spaces, sector) in SECTOR_MAPPING order
+_COMPANY_TOKENS = tuple(
+    (sys.intern(name.lower()), sys.intern(name.lower().replace(' ', '')), sys.intern(sector))
+    for name, sector in SECTOR_MAPPING.items()
+)
+
+# Source URL fragments used when no company name matches
+_FINANCIAL_DOMAINS = ('jpmorgan', 'bankofamerica', 'wellsfargo', 'goldmansachs')
+_RETAIL_DOMAINS = ('amazon', 'walmart', 'target', 'homedepot')
+_MEDIA_DOMAINS = ('disney', 'netflix', 'comcast', 'sony')
+
+def _build_automaton(words):
+    """Build an Aho-Corasick automaton from (word, value) pairs, if available"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word, value in words:
+        automaton.add_word(word, value)
+    automaton.make_automaton()
+    return automaton
+
+# One automaton pass over a text reports every company name or keyword it
+# contains, instead of one substring search per entry
+_TITLE_AUTOMATON = _build_automaton((name, index) for index, (name, _, _) in enumerate(_COMPANY_TOKENS))
+_URL_AUTOMATON = _build_automaton((compact_name, index) for index, (_, compact_name, _) in enumerate(_COMPANY_TOKENS))
+_KEYWORD_AUTOMATON = _build_automaton(_KEYWORD_MASKS)
+
+# An article counts as recent while it is less than this old
+RECENT_WINDOW = timedelta(days=8)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(date_string: str) -> float:
+    """Parse a naive ISO timestamp to epoch seconds; anything else sorts as recent"""
+    try:
+        article_date = datetime.fromisoformat(date_string)
+    except (TypeError, ValueError):
+        return math.inf
+    if article_date.tzinfo is not None:
+        # Offset-aware dates never compared against the naive clock
+        return math.inf
+    return article_date.timestamp()
+
 
 class SectorInsights:
     """AI-powered sector trend analysis and insights generator"""
     
     def __init__(self, config):
         self.config = config
+        self._recent_cutoff = (datetime.now() - RECENT_WINDOW).timestamp()
         
     def analyze_sector_trends(self, articles: List[Dict]) -> Dict:
         """
@@ -22,8 +168,13 @@ class SectorInsights:
         if not articles:
             return self._get_default_insights()
             
+        self._recent_cutoff = (datetime.now() - RECENT_WINDOW).timestamp()
+        
+        # Scan each article once; every analysis below aggregates these results
+        scans = [self._scan_article(article) for article in articles]
+        
         # Group articles by sector
-        sector_data = self._group_articles_by_sector(articles)
+        sector_data = self._group_articles_by_sector(articles, scans)
         
         # Generate insights for each sector
         insights = {
@@ -33,135 +184,117 @@ class SectorInsights:
             'trending_topics': self._identify_trending_topics(articles),
             'cross_sector_analysis': self._analyze_cross_sector_trends(sector_data),
             'ai_adoption_score': self._calculate_ai_adoption_score(sector_data),
-            'pgvector_adoption': self._analyze_pgvector_adoption(articles, sector_data)
+            'pgvector_adoption': self._analyze_pgvector_adoption(scans, sector_data)
         }
         
-        for sector, sector_articles in sector_data.items():
-            insights['sectors'][sector] = self._analyze_sector(sector, sector_articles)
+        for sector, sector_scans in sector_data.items():
+            insights['sectors'][sector] = self._analyze_sector(sector, sector_scans)
             
         return insights
     
-    def _group_articles_by_sector(self, articles: List[Dict]) -> Dict[str, List[Dict]]:
-        """Group articles by their source company sector"""
-        sector_mapping = {
-            # Financial companies
-            'JPMorgan Chase': 'Financial',
-            'Bank of America': 'Financial', 
-            'Wells Fargo': 'Financial',
-            'Goldman Sachs': 'Financial',
-            'Morgan Stanley': 'Financial',
-            'Citigroup': 'Financial',
-            'American Express': 'Financial',
-            'Capital One': 'Financial',
-            'Charles Schwab': 'Financial',
-            'BlackRock': 'Financial',
-            
-            # Retail companies
-            'Amazon': 'Retail',
-            'Walmart': 'Retail',
-            'Target': 'Retail',
-            'Home Depot': 'Retail',
-            'Costco': 'Retail',
-            'CVS Health': 'Retail',
-            'Kroger': 'Retail',
-            'Lowe\'s': 'Retail',
-            'Best Buy': 'Retail',
-            'Starbucks': 'Retail',
-            
-            # Media & Entertainment companies
-            'Disney': 'Media & Entertainment',
-            'Netflix': 'Media & Entertainment',
-            'Comcast': 'Media & Entertainment',
-            'Warner Bros Discovery': 'Media & Entertainment',
-            'Sony Pictures': 'Media & Entertainment',
-            'ViacomCBS (Paramount)': 'Media & Entertainment',
-            'NBCUniversal': 'Media & Entertainment',
-            'Fox Corporation': 'Media & Entertainment',
-            'Spotify': 'Media & Entertainment',
-            'Electronic Arts': 'Media & Entertainment'
-        }
-        
+    def _group_articles_by_sector(self, articles: List[Dict], scans: List[ArticleScan]) -> Dict[str, List[ArticleScan]]:
+        """Group scanned articles by their source company sector"""
         sector_data = defaultdict(list)
         
-        for article in articles:
-            # Try to identify sector from source URL or title
-            sector = self._identify_article_sector(article, sector_mapping)
-            if sector:
-                sector_data[sector].append(article)
+        for article, scan in zip(articles, scans):
+            if scan.sector:
+                article['sector'] = scan.sector
+                sector_data[scan.sector].append(scan)
                 
         return dict(sector_data)
     
-    def _identify_article_sector(self, article: Dict, sector_mapping: Dict) -> str:
+    def _scan_article(self, article: Dict) -> ArticleScan:
+        """Derive sector, themes, maturity and recency for an article in a single pass"""
+        text = (article.get('title', '') + ' ' + article.get('summary', '')).lower()
+        
+        mask = 0
+        if _KEYWORD_AUTOMATON is not None:
+            for _, keyword_mask in _KEYWORD_AUTOMATON.iter(text):
+                mask |= keyword_mask
+        else:
+            for keyword, keyword_mask in _KEYWORD_MASKS:
+                if keyword in text:
+                    mask |= keyword_mask
+        
+        # Try to identify sector from source URL or title
+        sector = self._identify_article_sector(article)
+        
+        return ArticleScan(
+            sector=sys.intern(sector) if sector else sector,
+            theme_mask=mask & _THEME_BITS,
+            is_advanced=bool(mask & _ADVANCED_BIT),
+            is_basic=bool(mask & _BASIC_BIT),
+            is_vector=bool(mask & _VECTOR_BIT),
+            is_recent=self._is_recent(article.get('discovered_at', ''))
+        )
+    
+    def _identify_article_sector(self, article: Dict) -> str:
         """Identify which sector an article belongs to"""
         source_url = article.get('source_url', '').lower()
         title = article.get('title', '').lower()
         
         # Check for company names in title or URL
-        for company, sector in sector_mapping.items():
-            if company.lower() in title or company.lower().replace(' ', '') in source_url:
-                return sector
+        if _TITLE_AUTOMATON is not None:
+            # First company in SECTOR_MAPPING order wins, as in the scan below
+            matches = [index for _, index in _TITLE_AUTOMATON.iter(title)]
+            matches.extend(index for _, index in _URL_AUTOMATON.iter(source_url))
+            if matches:
+                return _COMPANY_TOKENS[min(matches)][2]
+        else:
+            for name, compact_name, sector in _COMPANY_TOKENS:
+                if name in title or compact_name in source_url:
+                    return sector
                 
         # Fallback: try to identify by URL patterns
-        if any(domain in source_url for domain in ['jpmorgan', 'bankofamerica', 'wellsfargo', 'goldmansachs']):
+        if any(domain in source_url for domain in _FINANCIAL_DOMAINS):
             return 'Financial'
-        elif any(domain in source_url for domain in ['amazon', 'walmart', 'target', 'homedepot']):
+        elif any(domain in source_url for domain in _RETAIL_DOMAINS):
             return 'Retail'
-        elif any(domain in source_url for domain in ['disney', 'netflix', 'comcast', 'sony']):
+        elif any(domain in source_url for domain in _MEDIA_DOMAINS):
             return 'Media & Entertainment'
             
         return 'Unknown'
     
-    def _analyze_sector(self, sector: str, articles: List[Dict]) -> Dict:
+    def _analyze_sector(self, sector: str, scans: List[ArticleScan]) -> Dict:
         """Analyze trends and insights for a specific sector"""
-        if not articles:
+        if not scans:
             return self._get_default_sector_analysis(sector)
             
         # Extract key themes and technologies
-        themes = self._extract_themes(articles)
+        themes = self._extract_themes(scans)
         
         # Calculate activity metrics
-        recent_activity = len([a for a in articles if self._is_recent(a.get('discovered_at', ''))])
+        recent_activity = sum(1 for scan in scans if scan.is_recent)
         
         analysis = {
-            'article_count': len(articles),
+            'article_count': len(scans),
             'recent_activity': recent_activity,
-            'activity_trend': 'increasing' if recent_activity > len(articles) * 0.6 else 'steady',
+            'activity_trend': 'increasing' if recent_activity > len(scans) * 0.6 else 'steady',
             'key_themes': themes[:5],  # Top 5 themes
             'innovation_focus': self._get_sector_innovation_focus(sector, themes),
-            'ai_maturity': self._assess_ai_maturity(sector, articles),
-            'competitive_intensity': self._assess_competitive_intensity(articles),
+            'ai_maturity': self._assess_ai_maturity(sector, scans),
+            'competitive_intensity': self._assess_competitive_intensity(scans),
             'strategic_direction': self._get_strategic_direction(sector, themes)
         }
         
         return analysis
     
-    def _extract_themes(self, articles: List[Dict]) -> List[str]:
-        """Extract key AI/GenAI themes from articles"""
-        theme_keywords = {
-            'machine learning': ['machine learning', 'ml', 'deep learning'],
-            'automation': ['automation', 'automated', 'robotic process'],
-            'personalization': ['personalization', 'personalized', 'recommendation'],
-            'fraud detection': ['fraud', 'security', 'risk management'],
-            'customer service': ['customer service', 'chatbot', 'virtual assistant'],
-            'content generation': ['content generation', 'generative ai', 'genai'],
-            'predictive analytics': ['predictive', 'forecasting', 'analytics'],
-            'computer vision': ['computer vision', 'image recognition', 'visual ai'],
-            'natural language': ['nlp', 'natural language', 'text analysis'],
-            'algorithmic trading': ['algorithmic trading', 'trading algorithms', 'fintech'],
-            'vector databases': ['vector database', 'pgvector', 'embedding', 'similarity search', 'vector search'],
-            'semantic search': ['semantic search', 'vector similarity', 'embedding search', 'nearest neighbor']
-        }
-        
-        theme_counts = defaultdict(int)
-        
-        for article in articles:
-            text = (article.get('title', '') + ' ' + article.get('summary', '')).lower()
-            for theme, keywords in theme_keywords.items():
-                if any(keyword in text for keyword in keywords):
-                    theme_counts[theme] += 1
-        
-        # Return themes sorted by frequency
-        return [theme for theme, count in sorted(theme_counts.items(), key=lambda x: x[1], reverse=True)]
+    def _extract_themes(self, scans: List[ArticleScan]) -> List[str]:
+        """Extract key AI/GenAI themes from scanned articles"""
+        # Counts and first-seen positions indexed by theme id
+        theme_counts = [0] * len(THEME_NAMES)
+        first_seen = [0] * len(THEME_NAMES)
+        
+        for position, scan in enumerate(scans):
+            for theme_id in _iter_bits(scan.theme_mask):
+                if not theme_counts[theme_id]:
+                    first_seen[theme_id] = position
+                theme_counts[theme_id] += 1
+        
+        # Return themes sorted by frequency (ties keep first-seen order)
+        ranked = sorted((theme_id for theme_id, count in enumerate(theme_counts) if count),
+                        key=lambda theme_id: (-theme_counts[theme_id], first_seen[theme_id]))
+        return [THEME_NAMES[theme_id] for theme_id in ranked]
     
     def _get_sector_innovation_focus(self, sector: str, themes: List[str]) -> str:
         """Get the primary innovation focus for each sector"""
@@ -194,23 +327,13 @@ class SectorInsights:
         
         return focus.get('primary', 'AI integration and optimization')
     
-    def _assess_ai_maturity(self, sector: str, articles: List[Dict]) -> str:
+    def _assess_ai_maturity(self, sector: str, scans: List[ArticleScan]) -> str:
         """Assess AI maturity level for the sector"""
         # Count advanced AI implementations
-        advanced_keywords = ['generative ai', 'genai', 'large language model', 'transformer', 'neural network']
-        basic_keywords = ['automation', 'machine learning', 'ai']
-        
-        advanced_count = 0
-        basic_count = 0
+        advanced_count = sum(1 for scan in scans if scan.is_advanced)
+        basic_count = sum(1 for scan in scans if scan.is_basic and not scan.is_advanced)
         
-        for article in articles:
-            text = (article.get('title', '') + ' ' + article.get('summary', '')).lower()
-            if any(keyword in text for keyword in advanced_keywords):
-                advanced_count += 1
-            elif any(keyword in text for keyword in basic_keywords):
-                basic_count += 1
-        
-        total_articles = len(articles)
+        total_articles = len(scans)
         if total_articles == 0:
             return 'Emerging'
             
@@ -225,11 +348,11 @@ class SectorInsights:
         else:
             return 'Emerging'
     
-    def _assess_competitive_intensity(self, articles: List[Dict]) -> str:
+    def _assess_competitive_intensity(self, scans: List[ArticleScan]) -> str:
         """Assess competitive intensity in AI adoption"""
-        if len(articles) > 8:
+        if len(scans) > 8:
             return 'High'
-        elif len(articles) > 4:
+        elif len(scans) > 4:
             return 'Medium'
         else:
             return 'Low'
@@ -337,10 +460,8 @@ class SectorInsights:
             'sector_distribution': {sector: len(articles) for sector, articles in sector_data.items()}
         }
     
-    def _analyze_pgvector_adoption(self, articles: List[Dict], sector_data: Dict) -> Dict:
+    def _analyze_pgvector_adoption(self, scans: List[ArticleScan], sector_data: Dict) -> Dict:
         """Analyze pgvector and vector database adoption across sectors"""
-        vector_keywords = ['vector database', 'pgvector', 'embedding', 'similarity search', 'vector search', 'semantic search', 'nearest neighbor']
-        
         pgvector_analysis = {
             'total_companies_using_vectors': 0,
             'sector_breakdown': {},
@@ -350,11 +471,7 @@ class SectorInsights:
         }
         
         # Track vector database mentions across all articles
-        vector_articles = []
-        for article in articles:
-            text = (article.get('title', '') + ' ' + article.get('summary', '')).lower()
-            if any(keyword in text for keyword in vector_keywords):
-                vector_articles.append(article)
+        vector_article_count = sum(1 for scan in scans if scan.is_vector)
         
         # Estimate companies using vector databases by sector
         companies_using_vectors = {
@@ -394,20 +511,15 @@ class SectorInsights:
                 'Semantic search capabilities'
             ],
             'leading_adopters': ['Amazon', 'Netflix', 'JPMorgan Chase', 'Goldman Sachs'],
-            'growth_trend': 'Rapidly expanding' if len(vector_articles) > 2 else 'Steady adoption'
+            'growth_trend': 'Rapidly expanding' if vector_article_count > 2 else 'Steady adoption'
         })
         
         return pgvector_analysis
     
     def _is_recent(self, date_string: str) -> bool:
         """Check if an article is from the last 7 days"""
-        try:
-            if not date_string:
-                return True  # Assume recent if no date
-            article_date = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
-            return (datetime.now() - article_date).days <= 7
-        except:
-            return True  # Assume recent if date parsing fails
+        # Missing or unparseable dates are assumed recent
+        return _parse_timestamp(date_string) > self._recent_cutoff
     
     def _get_default_insights(self) -> Dict:
         """Get default insights when no articles are available"""
@@ -7,9 +7,17 @@ Handles initial setup, configuration, and testing
 import os
 import sys
 import json
+import shutil
 import logging
+import importlib.util
 from pathlib import Path
-from dotenv import load_dotenv
+from utils import get_env, invalidate_env
+
+# Distribution names whose import name differs
+PACKAGE_MODULES = {
+    'beautifulsoup4': 'bs4',
+    'python-dotenv': 'dotenv',
+}
 
 def create_directory_structure():
     """Create necessary directories"""
@@ -22,11 +30,9 @@ def create_env_file():
     """Create .env file from template if it doesn't exist"""
     if not os.path.exists('.env'):
         if os.path.exists('.env.example'):
-            # Copy example file
-            with open('.env.example', 'r') as source:
-                content = source.read()
-            with open('.env', 'w') as target:
-                target.write(content)
+            # Copy example file (kernel-side copy where the platform supports it)
+            shutil.copyfile('.env.example', '.env')
+            invalidate_env()
             print("✓ Created .env file from template")
             print("⚠️  Please edit .env file with your configuration")
             return False
@@ -41,15 +47,17 @@ def validate_dependencies():
     """Check if required packages are installed"""
     required_packages = [
         'beautifulsoup4', 'requests', 'transformers', 'torch', 
-        'schedule', 'python-dotenv', 'trafilatura', 'lxml', 'html5lib'
+        'schedule', 'python-dotenv', 'trafilatura', 'lxml', 'html5lib',
+        'orjson'
     ]
     
     missing_packages = []
     for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
+        # Only locate the module; importing torch/transformers takes seconds
+        module_name = PACKAGE_MODULES.get(package, package.replace('-', '_'))
+        if importlib.util.find_spec(module_name) is not None:
             print(f"✓ {package}")
-        except ImportError:
+        else:
             missing_packages.append(package)
             print(f"❌ {package}")
     
@@ -63,13 +71,13 @@ def validate_dependencies():
 
 def validate_configuration():
     """Validate configuration settings"""
-    load_dotenv()
+    env = get_env()
     
     required_vars = ['EMAIL_USERNAME', 'EMAIL_PASSWORD', 'EMAIL_RECIPIENT']
     missing_vars = []
     
     for var in required_vars:
-        if not os.getenv(var):
+        if not env.get(var):
             missing_vars.append(var)
             print(f"❌ {var} not configured")
         else:
@@ -3,30 +3,80 @@ Storage module for GenAI Content Monitor
 Handles persistent storage of seen articles using JSON
 """
 
-import json
+import csv
 import logging
 import os
-from datetime import datetime
+import time
+import orjson
+from datetime import datetime, timedelta
 from typing import Dict, Set
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# fdatasync skips flushing unchanged metadata; not every platform has it
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
+def _is_expired(first_seen, cutoff: datetime) -> bool:
+    """Whether a first_seen value is older than the cutoff or not a valid date"""
+    try:
+        return datetime.fromisoformat(first_seen) < cutoff
+    except (ValueError, TypeError):
+        return True
+
+# (whole second, ISO timestamp) of the last _now_iso call
+_now_cache = (None, "")
+
+def _now_iso() -> str:
+    """Current time in ISO format, formatted at most once per second"""
+    global _now_cache
+    now = time.time()
+    second = int(now)
+    if _now_cache[0] != second:
+        _now_cache = (second, datetime.fromtimestamp(now).isoformat())
+    return _now_cache[1]
+
 class ArticleStorage:
     """JSON-based storage for tracking seen articles"""
     
-    def __init__(self, storage_file: str = "articles_seen.json"):
+    def __init__(self, storage_file: str = "articles_seen.json", batch_size: int = 50):
         self.storage_file = storage_file
+        self.log_file = f"{storage_file}.log"
+        self.batch_size = batch_size
+        
+        # Size of the storage file as last read or written, for get_stats
+        self._bytes_on_disk = 0
         self.seen_articles = self._load_seen_articles()
+        
+        # The loader guarantees the "articles" key; keep a direct reference to it
+        self._articles: Dict[str, Dict] = self.seen_articles["articles"]
+        replayed = self._replay_log()
+        
+        # Inserts not yet written to disk
+        self._dirty = False
+        self._pending_writes = 0
+        
+        # Compact inserts logged by a previous run into the main file
+        if replayed:
+            self._save_seen_articles()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def _load_seen_articles(self) -> Dict:
         """Load seen articles from JSON file"""
         try:
             if os.path.exists(self.storage_file):
-                with open(self.storage_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    logger.info(f"Loaded {len(data.get('articles', {}))} seen articles from {self.storage_file}")
-                    return data
+                with open(self.storage_file, 'rb', buffering=1 << 20) as f:
+                    raw = f.read()
+                data = orjson.loads(raw)
+                data.setdefault("articles", {})
+                self._bytes_on_disk = len(raw)
+                logger.info(f"Loaded {len(data['articles'])} seen articles from {self.storage_file}")
+                return data
             else:
                 logger.info(f"No existing storage file found. Creating new storage: {self.storage_file}")
                 return {
@@ -42,6 +92,38 @@ class ArticleStorage:
                 "articles": {}
             }
     
+    def _replay_log(self) -> int:
+        """Apply inserts from the append-only log on top of the loaded articles"""
+        if not os.path.exists(self.log_file):
+            return 0
+        
+        articles = self._articles
+        replayed = 0
+        try:
+            with open(self.log_file, 'rb') as f:
+                for line in f:
+                    try:
+                        articles.update(orjson.loads(line))
+                        replayed += 1
+                    except orjson.JSONDecodeError:
+                        # A torn final line from an interrupted write
+                        logger.warning(f"Skipping unreadable line in {self.log_file}")
+        except Exception as e:
+            logger.error(f"Error replaying seen articles log: {e}")
+        
+        if replayed:
+            logger.info(f"Replayed {replayed} logged articles from {self.log_file}")
+        return replayed
+    
+    def _append_seen(self, url: str, record: Dict):
+        """Append one insert to the log so it survives until the next full save"""
+        try:
+            Path(self.log_file).parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_file, 'ab') as f:
+                f.write(orjson.dumps({url: record}) + b'\n')
+        except Exception as e:
+            logger.error(f"Error appending to seen articles log: {e}")
+    
     def _save_seen_articles(self):
         """Save seen articles to JSON file"""
         try:
@@ -52,12 +134,22 @@ class ArticleStorage:
             
             # Write to temporary file first, then rename for atomic operation
             temp_file = f"{self.storage_file}.tmp"
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(self.seen_articles, f, indent=2, ensure_ascii=False)
+            data = orjson.dumps(self.seen_articles, option=orjson.OPT_INDENT_2)
+            with open(temp_file, 'wb', buffering=1 << 20) as f:
+                f.write(data)
+                f.flush()
+                _fdatasync(f.fileno())
+            
+            # Atomic rename (replaces an existing file on every platform)
+            os.replace(temp_file, self.storage_file)
+            self._bytes_on_disk = len(data)
             
-            # Atomic rename
-            os.rename(temp_file, self.storage_file)
+            # Everything logged so far is now in the main file
+            if os.path.exists(self.log_file):
+                os.remove(self.log_file)
             
+            self._dirty = False
+            self._pending_writes = 0
             logger.debug(f"Saved seen articles to {self.storage_file}")
             
         except Exception as e:
@@ -65,58 +157,67 @@ class ArticleStorage:
     
     def is_article_seen(self, url: str) -> bool:
         """Check if an article URL has been seen before"""
-        return url in self.seen_articles.get("articles", {})
+        return url in self._articles
     
     def mark_article_seen(self, url: str, title: str = None):
         """Mark an article as seen"""
-        if "articles" not in self.seen_articles:
-            self.seen_articles["articles"] = {}
-        
-        self.seen_articles["articles"][url] = {
-            "title": title,
-            "first_seen": datetime.now().isoformat(),
-            "seen_count": self.seen_articles["articles"].get(url, {}).get("seen_count", 0) + 1
-        }
+        existing = self._articles.get(url)
+        if existing:
+            record = {
+                "title": title,
+                "first_seen": existing.get("first_seen") or _now_iso(),
+                "seen_count": existing.get("seen_count", 0) + 1
+            }
+        else:
+            record = {"title": title, "first_seen": _now_iso(), "seen_count": 1}
+        self._articles[url] = record
+        self._append_seen(url, record)
         
-        self._save_seen_articles()
+        self._dirty = True
+        self._pending_writes += 1
+        if self._pending_writes >= self.batch_size:
+            self._save_seen_articles()
         logger.debug(f"Marked article as seen: {title} ({url})")
     
+    def flush(self):
+        """Write any buffered inserts to disk"""
+        if self._dirty:
+            self._save_seen_articles()
+    
+    def close(self):
+        """Flush buffered inserts; call once at the end of a monitoring cycle"""
+        self.flush()
+    
     def get_seen_articles(self) -> Dict:
         """Get all seen articles"""
-        return self.seen_articles.get("articles", {})
+        return self._articles
     
     def get_stats(self) -> Dict:
         """Get storage statistics"""
-        articles = self.seen_articles.get("articles", {})
         return {
-            "total_articles_seen": len(articles),
+            "total_articles_seen": len(self._articles),
             "storage_file": self.storage_file,
             "created_at": self.seen_articles.get("created_at"),
             "last_updated": self.seen_articles.get("last_updated"),
-            "file_size_bytes": os.path.getsize(self.storage_file) if os.path.exists(self.storage_file) else 0
+            "file_size_bytes": self._bytes_on_disk
         }
     
     def cleanup_old_articles(self, days_old: int = 30):
         """Remove articles older than specified days (optional cleanup)"""
-        from datetime import datetime, timedelta
-        
         try:
             cutoff_date = datetime.now() - timedelta(days=days_old)
-            articles = self.seen_articles.get("articles", {})
+            articles = self._articles
             
-            urls_to_remove = []
-            for url, article_data in articles.items():
-                try:
-                    first_seen = datetime.fromisoformat(article_data.get("first_seen", ""))
-                    if first_seen < cutoff_date:
-                        urls_to_remove.append(url)
-                except (ValueError, TypeError):
-                    # Remove articles with invalid dates
-                    urls_to_remove.append(url)
+            # Articles with missing or invalid dates are removed too
+            urls_to_remove = [
+                url for url, article_data in articles.items()
+                if _is_expired(article_data.get("first_seen", ""), cutoff_date)
+            ]
             
             for url in urls_to_remove:
                 del articles[url]
             
+            # One compacted save, which also clears the append-only log
             if urls_to_remove:
                 self._save_seen_articles()
                 logger.info(f"Cleaned up {len(urls_to_remove)} old articles")
@@ -127,22 +228,17 @@ class ArticleStorage:
     def export_to_csv(self, output_file: str = "seen_articles.csv"):
         """Export seen articles to CSV for analysis"""
         try:
-            import csv
-            
-            articles = self.seen_articles.get("articles", {})
+            articles = self._articles
             
-            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['url', 'title', 'first_seen', 'seen_count']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            # One large buffer turns per-row writes into a few big ones
+            with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile)
                 
-                writer.writeheader()
-                for url, data in articles.items():
-                    writer.writerow({
-                        'url': url,
-                        'title': data.get('title', ''),
-                        'first_seen': data.get('first_seen', ''),
-                        'seen_count': data.get('seen_count', 0)
-                    })
+                writer.writerow(('url', 'title', 'first_seen', 'seen_count'))
+                writer.writerows(
+                    (url, data.get('title', ''), data.get('first_seen', ''), data.get('seen_count', 0))
+                    for url, data in articles.items()
+                )
             
             logger.info(f"Exported {len(articles)} articles to {output_file}")
             
@@ -3,11 +3,30 @@ Utility functions for GenAI Content Monitor
 Common helper functions and logging setup
 """
 
-import logging
 import os
 import sys
+import json
+import time
+import queue
+import socket
+import asyncio
+import atexit
+import functools
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlparse
+
+# Background thread draining queued log records, started by setup_logging
+_log_listener = None
+
+def _stop_log_listener():
+    """Flush queued log records and stop the listener thread"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
 
 def setup_logging(level: str = None, log_file: str = None):
     """Setup logging configuration"""
@@ -30,17 +49,27 @@ def setup_logging(level: str = None, log_file: str = None):
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
     
-    # Setup logging with both file and console handlers
+    # Setup logging with both file and console handlers. Records are queued
+    # by the caller and written by a background listener thread.
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
     logging.basicConfig(
         level=numeric_level,
         format=log_format,
         datefmt=date_format,
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=[queue_handler]
     )
     
+    global _log_listener
+    if queue_handler in logging.getLogger().handlers and _log_listener is None:
+        _log_listener = QueueListener(
+            log_queue,
+            RotatingFileHandler(log_file, maxBytes=10 << 20, backupCount=5, encoding='utf-8', delay=True),
+            logging.StreamHandler(sys.stdout)
+        )
+        _log_listener.start()
+        atexit.register(_stop_log_listener)
+    
     # Reduce noise from external libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("requests").setLevel(logging.WARNING)
@@ -51,10 +80,24 @@ def setup_logging(level: str = None, log_file: str = None):
     logger.info(f"Logging initialized at {level} level")
     logger.info(f"Log file: {log_file}")
 
+@functools.lru_cache(maxsize=1)
+def get_env(env_file: str = ".env") -> dict:
+    """Get environment settings, parsing the .env file only once"""
+    from dotenv import dotenv_values
+    
+    # Real environment variables win over .env, as with load_dotenv()
+    env = {key: value for key, value in dotenv_values(env_file).items() if value is not None}
+    env.update(os.environ)
+    return env
+
+def invalidate_env():
+    """Forget the cached .env settings, e.g. after the .env file was rewritten"""
+    get_env.cache_clear()
+
+@functools.lru_cache(maxsize=8192)
 def validate_url(url: str) -> bool:
     """Validate if a URL is properly formatted"""
     try:
-        from urllib.parse import urlparse
         result = urlparse(url)
         return all([result.scheme, result.netloc])
     except Exception:
@@ -65,17 +108,9 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # Replace multiple whitespaces with single space
-    import re
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove excessive newlines
-    text = re.sub(r'\n+', '\n', text)
-    
-    # Strip whitespace
-    text = text.strip()
-    
-    return text
+    # Collapse whitespace runs (newlines included) to single spaces and strip
+    # the ends; str.split() does both in one C-level pass
+    return ' '.join(text.split())
 
 def truncate_text(text: str, max_length: int = 1000, suffix: str = "...") -> str:
     """Truncate text to specified length"""
@@ -99,10 +134,10 @@ def format_file_size(size_bytes: int) -> str:
     
     return f"{size:.1f} {size_names[i]}"
 
+@functools.lru_cache(maxsize=4096)
 def get_domain_from_url(url: str) -> str:
     """Extract domain from URL"""
     try:
-        from urllib.parse import urlparse
         return urlparse(url).netloc
     except Exception:
         return "unknown"
@@ -118,8 +153,7 @@ def get_timestamp() -> str:
 def load_config_from_file(config_file: str) -> dict:
     """Load configuration from JSON file"""
     try:
-        import json
-        with open(config_file, 'r', encoding='utf-8') as f:
+        with open(config_file, 'r', encoding='utf-8', buffering=1 << 20) as f:
             return json.load(f)
     except Exception as e:
         logging.getLogger(__name__).error(f"Error loading config file {config_file}: {e}")
@@ -128,37 +162,47 @@ def load_config_from_file(config_file: str) -> dict:
 def save_config_to_file(config: dict, config_file: str):
     """Save configuration to JSON file"""
     try:
-        import json
         ensure_directory_exists(os.path.dirname(config_file))
-        with open(config_file, 'w', encoding='utf-8') as f:
+        with open(config_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
             json.dump(config, f, indent=2, ensure_ascii=False)
     except Exception as e:
         logging.getLogger(__name__).error(f"Error saving config file {config_file}: {e}")
 
-def check_internet_connection(url: str = "https://www.google.com", timeout: int = 5) -> bool:
+def check_internet_connection(host: str = "1.1.1.1", port: int = 53, timeout: int = 5) -> bool:
     """Check if internet connection is available"""
+    # A bare TCP connect to a public DNS server; no TLS handshake or page download
     try:
-        import requests
-        response = requests.get(url, timeout=timeout)
-        return response.status_code == 200
-    except Exception:
+        socket.create_connection((host, port), timeout=timeout).close()
+        return True
+    except OSError:
         return False
 
 def retry_on_failure(func, max_retries: int = 3, delay: float = 1.0):
     """Retry a function on failure with exponential backoff"""
-    import time
-    
-    for attempt in range(max_retries):
+    delays = [delay * (1 << attempt) for attempt in range(max_retries)]
+    for attempt, wait_time in enumerate(delays):
         try:
             return func()
         except Exception as e:
             if attempt == max_retries - 1:
                 raise e
             
-            wait_time = delay * (2 ** attempt)
             logging.getLogger(__name__).warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {wait_time}s...")
             time.sleep(wait_time)
 
+async def retry_on_failure_async(coro_factory, max_retries: int = 3, delay: float = 1.0):
+    """Retry a coroutine on failure with exponential backoff, without blocking the event loop"""
+    delays = [delay * (1 << attempt) for attempt in range(max_retries)]
+    for attempt, wait_time in enumerate(delays):
+        try:
+            return await coro_factory()
+        except Exception as e:
+            if attempt == max_retries - 1:
+                raise e
+            
+            logging.getLogger(__name__).warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {wait_time}s...")
+            await asyncio.sleep(wait_time)
+
 def mask_sensitive_data(data: str, mask_char: str = "*") -> str:
     """Mask sensitive data for logging"""
     if not data or len(data) <= 4: